@@ -0,0 +1,201 @@
+"""Bit-packed board representation and SWAR evolution for Conway's rule.
+
+This module stores each grid row as a run of uint64 words, one bit per
+cell, and advances the whole board with bitwise adders so that 64 cells are
+updated by every word operation. Helpers convert between the packed form
+and the regular uint8 grid used by Board for display and snapshots.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from game_of_life.rules import _check_out
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the NumPy path
+    njit = None
+
+WORD_BITS = 64
+"""Number of cells stored in each packed word."""
+
+_ONE = np.uint64(1)
+_HIGH = np.uint64(WORD_BITS - 1)
+
+
+def packed_width(cols: int) -> int:
+    """Returns the number of uint64 words needed to hold a row of cols cells."""
+    return (cols + WORD_BITS - 1) // WORD_BITS
+
+
+def pack(grid: np.ndarray) -> np.ndarray:
+    """Packs a 2D 0/1 grid into rows of uint64 words.
+
+    Bit j of word k in a row holds the cell in column k*64 + j. Bits past
+    the last column are zero.
+
+    Args:
+        grid: 2D array (or nested list) of cell states (0=dead, 1=alive).
+
+    Returns:
+        Array of shape (rows, ceil(cols/64)) with dtype uint64.
+    """
+    grid = np.asarray(grid, dtype=np.uint8)
+    rows, cols = grid.shape
+    width = packed_width(cols)
+    packed_bytes = np.zeros((rows, width * 8), dtype=np.uint8)
+    packed_bytes[:, : (cols + 7) // 8] = np.packbits(grid, axis=1, bitorder="little")
+    return packed_bytes.view("<u8").astype(np.uint64)
+
+
+def unpack(words: np.ndarray, cols: int) -> np.ndarray:
+    """Unpacks uint64 word rows back into a 2D uint8 grid.
+
+    Args:
+        words: Packed board as returned by pack or evolve_packed.
+        cols: Number of columns in the unpacked grid.
+
+    Returns:
+        2D uint8 array of shape (rows, cols).
+    """
+    as_bytes = words.astype("<u8").view(np.uint8)
+    return np.unpackbits(as_bytes, axis=1, count=cols, bitorder="little")
+
+
+def _last_word_mask(cols: int) -> np.uint64:
+    """Returns the mask of valid cell bits in the last word of a row."""
+    tail = cols % WORD_BITS
+    if tail == 0:
+        return np.uint64(0xFFFFFFFFFFFFFFFF)
+    return np.uint64((1 << tail) - 1)
+
+
+def _evolve_packed_numpy(words: np.ndarray, out: np.ndarray, last_mask) -> None:
+    """Vectorized SWAR step over all words of the board at once."""
+    zero_col = np.zeros((words.shape[0], 1), dtype=np.uint64)
+    # Value of the west (c-1) and east (c+1) neighbor moved onto each bit.
+    west = (words << _ONE) | np.hstack((zero_col, words[:, :-1] >> _HIGH))
+    east = (words >> _ONE) | np.hstack((words[:, 1:] << _HIGH, zero_col))
+
+    # Horizontal three-cell sums as 2-bit numbers (h1 h0), and the
+    # two-cell sums (m1 m0) that exclude the center for the middle row.
+    h0 = west ^ words ^ east
+    h1 = (west & words) | (east & (west ^ words))
+    m0 = west ^ east
+    m1 = west & east
+
+    zero_row = np.zeros((1, words.shape[1]), dtype=np.uint64)
+    a0 = np.vstack((zero_row, h0[:-1]))
+    a1 = np.vstack((zero_row, h1[:-1]))
+    b0 = np.vstack((h0[1:], zero_row))
+    b1 = np.vstack((h1[1:], zero_row))
+
+    # Add the three ones-bits; the carry joins the three twos-bits.
+    t0 = a0 ^ m0 ^ b0
+    c0 = (a0 & m0) | (b0 & (a0 ^ m0))
+    # The count is 2 or 3 exactly when one of the four twos-bits is set.
+    u = a1 ^ m1
+    v = b1 ^ c0
+    many = (a1 & m1) | (b1 & c0) | (u & v)
+    two_or_three = (u ^ v) & ~many
+
+    out[...] = two_or_three & (t0 | words)
+    out[:, -1] &= last_mask
+
+
+if njit is not None:
+
+    @njit(cache=True, nogil=True)
+    def _evolve_packed_numba(words, out, last_mask):
+        """Numba SWAR step iterating word by word with the same adder logic.
+
+        Releases the GIL so a background evolution thread does not block
+        the UI thread while it runs.
+        """
+        rows, width = words.shape
+        for r in range(rows):
+            for k in range(width):
+                a0 = np.uint64(0)
+                a1 = np.uint64(0)
+                b0 = np.uint64(0)
+                b1 = np.uint64(0)
+                m0 = np.uint64(0)
+                m1 = np.uint64(0)
+                center = words[r, k]
+                for dr in range(-1, 2):
+                    nr = r + dr
+                    if nr < 0 or nr >= rows:
+                        continue
+                    x = words[nr, k]
+                    west = x << np.uint64(1)
+                    east = x >> np.uint64(1)
+                    if k > 0:
+                        west |= words[nr, k - 1] >> np.uint64(63)
+                    if k + 1 < width:
+                        east |= words[nr, k + 1] << np.uint64(63)
+                    if dr == 0:
+                        m0 = west ^ east
+                        m1 = west & east
+                    else:
+                        s0 = west ^ x ^ east
+                        s1 = (west & x) | (east & (west ^ x))
+                        if dr < 0:
+                            a0 = s0
+                            a1 = s1
+                        else:
+                            b0 = s0
+                            b1 = s1
+                t0 = a0 ^ m0 ^ b0
+                c0 = (a0 & m0) | (b0 & (a0 ^ m0))
+                u = a1 ^ m1
+                v = b1 ^ c0
+                many = (a1 & m1) | (b1 & c0) | (u & v)
+                result = (u ^ v) & ~many & (t0 | center)
+                if k == width - 1:
+                    result &= last_mask
+                out[r, k] = result
+
+
+def evolve_packed(
+    words: np.ndarray, cols: int, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Advances a packed board by one generation of Conway's rule (B3/S23).
+
+    Neighbor counts are formed with bitwise half/full adders across the
+    three rows around each cell, then birth and survival are resolved with
+    masks, so no per-cell branching takes place. Cells outside the board
+    are treated as dead.
+
+    Args:
+        words: Packed board as returned by pack.
+        cols: Number of real columns in the board.
+        out: Optional preallocated C-contiguous uint64 array of the same
+            shape for the result. Must not share memory with words.
+
+    Returns:
+        Packed board for the next generation (out, if it was given).
+
+    Raises:
+        ValueError: If words is not a 2D uint64 array packed for cols
+            columns, or out is not a valid separate buffer of its shape.
+    """
+    if not isinstance(words, np.ndarray) or words.dtype != np.uint64:
+        raise ValueError("words must be a uint64 array as returned by pack")
+    if words.ndim != 2 or words.shape[1] != packed_width(cols):
+        raise ValueError(
+            f"words of shape {words.shape} do not hold rows of {cols} cells"
+        )
+    if out is None:
+        out = np.empty_like(words)
+    else:
+        _check_out(words, out, dtype=np.uint64)
+    if words.size == 0:
+        return out
+
+    last_mask = _last_word_mask(cols)
+    if njit is not None:
+        _evolve_packed_numba(words, out, last_mask)
+    else:
+        _evolve_packed_numpy(words, out, last_mask)
+    return out
@@ -5,9 +5,33 @@ initialization, pattern loading, state persistence, and grid manipulation.
 """
 
 from pathlib import Path
+
+import numpy as np
+
 from game_of_life.errors import GridSizeError
 from game_of_life.patterns import parse_pattern_file
 
+_SNAPSHOT_TABLE = bytes.maketrans(b"\x00\x01", b".*")
+"""Byte translation table mapping cell states 0/1 to '.'/'*'."""
+
+
+def write_snapshot_file(path, data: bytes):
+    """Writes an encoded snapshot to path through an unbuffered file.
+
+    Snapshots are always written in one piece, so the buffered writer that
+    Path.write_bytes puts in front of the file only adds a copy and an
+    extra object per call. Opening with buffering=0 hands the bytes
+    straight to the OS; the loop covers short writes.
+
+    Args:
+        path: Destination file path; the file is created or truncated.
+        data: Complete snapshot contents.
+    """
+    with Path(path).open("wb", buffering=0) as f:
+        view = memoryview(data)
+        while view:
+            view = view[f.write(view):]
+
 
 class Board:
     """Represents the Game of Life grid with pattern loading and persistence.
@@ -19,7 +43,9 @@ class Board:
     Attributes:
         rows: Number of rows in the grid.
         cols: Number of columns in the grid.
-        grid: 2D list representing cell states (0=dead, 1=alive).
+        grid: 2D uint8 array representing cell states (0=dead, 1=alive).
+            Anything assigned to it is stored as a C-contiguous uint8
+            array, one byte per cell.
     """
 
     def __init__(self, rows: int, cols: int):
@@ -39,7 +65,23 @@ class Board:
             raise GridSizeError(f"Invalid grid size: {rows}x{cols}")
         self.rows = rows
         self.cols = cols
-        self.grid = [[0 for _ in range(cols)] for _ in range(rows)]
+        self.grid = np.zeros((rows, cols), dtype=np.uint8)
+
+    @property
+    def grid(self) -> np.ndarray:
+        """The current cell states as a (rows, cols) uint8 array."""
+        return self._grid
+
+    @grid.setter
+    def grid(self, value):
+        """Stores value as a dense uint8 array.
+
+        Nested lists or wider integer arrays are converted once here, so
+        every later generation works on one contiguous byte per cell. A
+        grid that is already contiguous uint8 is stored as-is, which keeps
+        buffer swaps free.
+        """
+        self._grid = np.ascontiguousarray(value, dtype=np.uint8)
 
     def load_pattern(self, pattern_path: str):
         """Loads an initial pattern from a file into the grid.
@@ -58,7 +100,7 @@ class Board:
             ValueError: If the pattern file format is invalid.
         """
         path = Path(pattern_path)
-        rows, cols, live_cells = parse_pattern_file(path)
+        rows, cols, live_rows, live_cols = parse_pattern_file(path)
 
         if rows > self.rows or cols > self.cols:
             raise GridSizeError(
@@ -66,18 +108,33 @@ class Board:
             )
 
         self.clear()
-        for r, c in live_cells:
-            self.grid[r][c] = 1
+        self.grid[live_rows, live_cols] = 1
 
     def clear(self):
         """Resets all cells in the grid to dead state.
 
-        Sets every cell in the grid to 0 (dead), effectively clearing
-        the board for a fresh pattern or simulation.
+        Sets every cell in the grid to 0 (dead) with a single in-place
+        fill, effectively clearing the board for a fresh pattern or
+        simulation.
+        """
+        self.grid.fill(0)
+
+    def snapshot_bytes(self) -> bytes:
+        """Encodes the current grid state as an ASCII snapshot.
+
+        Copies the grid into a (rows, cols + 1) byte buffer whose last
+        column is a newline, then maps cell states to '.'/'*' with a single
+        bytes.translate call instead of a Python branch per cell. Cheap
+        enough to call on the simulation thread, so the result can be
+        handed off to a background writer.
+
+        Returns:
+            The snapshot contents, one row per line, as bytes.
         """
-        for r in range(self.rows):
-            for c in range(self.cols):
-                self.grid[r][c] = 0
+        frame = np.empty((self.rows, self.cols + 1), dtype=np.uint8)
+        frame[:, :-1] = self.grid
+        frame[:, -1] = ord("\n")
+        return frame.tobytes().translate(_SNAPSHOT_TABLE)
 
     def save_snapshot(self, out_path: str):
         """Saves the current grid state to a text file.
@@ -96,7 +153,4 @@ class Board:
         path = Path(out_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with path.open("w", encoding="utf-8") as f:
-            for row in self.grid:
-                line = "".join("*" if cell == 1 else "." for cell in row)
-                f.write(line + "\n")
+        write_snapshot_file(path, self.snapshot_bytes())
@@ -0,0 +1,82 @@
+"""Cycle detection and replay for successive Game of Life generations.
+
+Every finite board eventually revisits an earlier state, after which the
+run repeats forever (a still life is a cycle of length one). This module
+remembers the states seen so far and, as soon as one repeats, replays the
+cycle from cache instead of evolving it again. The batch runner and the
+visualizations share it.
+"""
+
+import itertools
+from typing import Callable, Iterator, Optional
+
+import numpy as np
+
+MAX_CYCLE_CACHE_BYTES = 64 * 1024 * 1024
+"""Approximate memory budget for the states remembered for cycle detection."""
+
+
+def replay_cycles(
+    grid: np.ndarray,
+    step: Callable[[], np.ndarray],
+    count: Optional[int] = None,
+    encode: Optional[Callable[[np.ndarray], object]] = None,
+    max_bytes: Optional[int] = MAX_CYCLE_CACHE_BYTES,
+) -> Iterator[object]:
+    """Yields a value for each successive generation, replaying cycles.
+
+    Every state is remembered by its raw bytes together with its value.
+    Once a state repeats, the cached values from its first occurrence on
+    are yielded in turn and step is never called again. step is also not
+    called after the last of count values, so no generation is evolved
+    needlessly.
+
+    Args:
+        grid: Array holding the initial generation, in whatever form step
+            returns (e.g. a uint8 grid or bit-packed words).
+        step: No-argument function evolving one generation and returning
+            it. The returned array may be a reused buffer.
+        count: Number of values to yield, including the initial
+            generation's. None yields forever.
+        encode: Optional function turning a state into the value to yield
+            and cache. By default the value is a read-only array viewing the
+            stored state bytes, so a state revisited on a cycle is the very
+            same array every time.
+        max_bytes: Approximate memory budget for remembered states; the
+            oldest are dropped beyond it, which only means very long periods
+            go undetected. None keeps every state.
+
+    Yields:
+        The value for generations 0, 1, 2, ...
+    """
+    max_states = None
+    if max_bytes is not None:
+        # The default value shares the key's bytes; an encoded one is
+        # assumed to be about as large as the state again.
+        state_bytes = grid.nbytes if encode is None else 2 * grid.nbytes
+        max_states = max(1, max_bytes // (state_bytes + 1))
+    seen = {}  # state bytes -> value, in insertion order
+    produced = 0
+    state = grid
+
+    while count is None or produced < count:
+        key = state.tobytes()
+        if key in seen:
+            states = list(seen)
+            cycle = [seen[k] for k in states[states.index(key):]]
+            remaining = None if count is None else count - produced
+            yield from itertools.islice(itertools.cycle(cycle), remaining)
+            return
+
+        if encode is None:
+            value = np.frombuffer(key, dtype=state.dtype).reshape(state.shape)
+        else:
+            value = encode(state)
+        seen[key] = value
+        if max_states is not None and len(seen) > max_states:
+            del seen[next(iter(seen))]
+        yield value
+
+        produced += 1
+        if count is None or produced < count:
+            state = step()
@@ -4,8 +4,14 @@ This module handles parsing of pattern description files that specify initial
 cell positions using coordinate notation.
 """
 
+import functools
+import mmap
 import re
+from array import array
 from pathlib import Path
+
+import numpy as np
+
 from game_of_life.errors import PatternParseError
 
 
@@ -16,6 +22,24 @@ Matches lines like "(1, 2) *" or "(0,4) ." with flexible whitespace.
 Captures three groups: row number, column number, and cell symbol (* or .).
 """
 
+COORD_BUFFER_RE = re.compile(
+    rb"^[^\S\n]*(?:"
+    rb"\([^\S\n]*(\d+)[^\S\n]*,[^\S\n]*(\d+)[^\S\n]*\)[^\S\n]+([*.])[^\S\n]*$"
+    rb"|[^\s#])",
+    re.MULTILINE,
+)
+"""Bytes counterpart of COORD_LINE_RE for scanning a whole file at once.
+
+Matches every line that is neither blank nor a comment. Well-formed
+coordinate lines capture (row, col, symbol); any other content line matches
+the second branch and yields three empty groups, which marks the file as
+malformed. Whitespace is restricted to characters other than newline so a
+single match can never span two lines.
+"""
+
+_MALFORMED = (b"", b"", b"")
+"""findall result for a content line that is not a coordinate entry."""
+
 
 def parse_pattern_file(path: Path):
     """Parses a pattern description file into live cell coordinates.
@@ -26,19 +50,26 @@ def parse_pattern_file(path: Path):
     and dead cells with '.'.
 
     The grid dimensions are automatically inferred from the maximum row and
-    column values found in the file.
+    column values found in the file. Results are cached per file path and
+    invalidated when the file's modification time or size changes, so
+    repeated loads of the same pattern skip file I/O and regex matching.
 
     Args:
         path: Path object pointing to the pattern file to parse.
 
     Returns:
-        A tuple of (rows, cols, live_cells) where:
+        A tuple of (rows, cols, live_rows, live_cols) where:
             - rows (int): Inferred grid height (max_row + 1)
             - cols (int): Inferred grid width (max_col + 1)
-            - live_cells (list): List of (row, col) tuples for live cells
+            - live_rows (np.ndarray): Row index of each live cell
+            - live_cols (np.ndarray): Column index of each live cell
+
+        The index arrays are read-only and can be used directly for fancy
+        indexing, e.g. ``grid[live_rows, live_cols] = 1``.
 
     Raises:
-        PatternParseError: If the file doesn't exist or contains malformed lines.
+        PatternParseError: If the file doesn't exist, contains malformed lines,
+            or has a coordinate that does not fit in a 64-bit integer.
 
     Note:
         Pattern file format:
@@ -50,9 +81,79 @@ def parse_pattern_file(path: Path):
     if not path.exists():
         raise PatternParseError(f"Pattern file not found: {path}")
 
-    live_cells = []
-    max_row = 0
-    max_col = 0
+    stat = path.stat()
+    return _parse_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_cached(path_str: str, mtime_ns: int, size: int):
+    """Caches parse results keyed on the file's resolved path, mtime and size.
+
+    The mtime and size arguments are only part of the cache key; they make
+    an edited file miss the cache and be parsed again.
+    """
+    return _parse_uncached(Path(path_str))
+
+
+def _parse_uncached(path: Path):
+    """Reads and parses a pattern file without consulting the cache.
+
+    Memory-maps the file and extracts every coordinate line with a single
+    findall sweep over the whole buffer. If any non-blank, non-comment line
+    is not a coordinate entry, or a coordinate does not fit in 64 bits, the
+    file is re-parsed line by line to report the offending line.
+
+    Returns the same (rows, cols, live_rows, live_cols) tuple as
+    parse_pattern_file.
+    """
+    with path.open("rb") as f:
+        if path.stat().st_size == 0:
+            return _live_arrays(array("q"), array("q"))
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            # findall hands back plain tuples of the captured groups, so no
+            # Match object is built and queried per coordinate line.
+            matches = COORD_BUFFER_RE.findall(buf)
+
+    if _MALFORMED in matches:
+        return _parse_lines(path)
+
+    live_rows = array("q")
+    live_cols = array("q")
+    try:
+        for row, col, symbol in matches:
+            if symbol == b"*":
+                live_rows.append(int(row))
+                live_cols.append(int(col))
+    except OverflowError:
+        return _parse_lines(path)
+    return _live_arrays(live_rows, live_cols)
+
+
+def _live_arrays(live_rows: array, live_cols: array):
+    """Builds the (rows, cols, live_rows, live_cols) parse result.
+
+    Live cells are kept as two flat int64 arrays rather than a list of
+    (row, col) tuples, which avoids a tuple object per cell. The arrays are
+    exposed as read-only NumPy views so cached results cannot be mutated.
+    """
+    rows_arr = np.frombuffer(live_rows, dtype=np.int64)
+    cols_arr = np.frombuffer(live_cols, dtype=np.int64)
+    rows_arr.flags.writeable = False
+    cols_arr.flags.writeable = False
+    rows = int(rows_arr.max()) + 1 if rows_arr.size else 1
+    cols = int(cols_arr.max()) + 1 if cols_arr.size else 1
+    return rows, cols, rows_arr, cols_arr
+
+
+def _parse_lines(path: Path):
+    """Parses a pattern file one line at a time.
+
+    Slower than the buffer scan in _parse_uncached, but knows the line
+    number of every entry, so it is used to report malformed lines and
+    out-of-range coordinates.
+    """
+    live_rows = array("q")
+    live_cols = array("q")
 
     with path.open("r", encoding="utf-8") as f:
         for line_no, line in enumerate(f, start=1):
@@ -64,14 +165,13 @@ def parse_pattern_file(path: Path):
             if not m:
                 raise PatternParseError(f"Malformed line {line_no} in {path}: {line!r}")
 
-            row = int(m.group(1))
-            col = int(m.group(2))
-            symbol = m.group(3)
-            if symbol == "*":
-                live_cells.append((row, col))
-                max_row = max(max_row, row)
-                max_col = max(max_col, col)
-
-    rows = max_row + 1
-    cols = max_col + 1
-    return rows, cols, live_cells
+            if m.group(3) == "*":
+                try:
+                    live_rows.append(int(m.group(1)))
+                    live_cols.append(int(m.group(2)))
+                except OverflowError:
+                    raise PatternParseError(
+                        f"Coordinate out of range on line {line_no} in {path}: {line!r}"
+                    ) from None
+
+    return _live_arrays(live_rows, live_cols)
@@ -5,12 +5,55 @@ saving the state of each generation to disk for later analysis or replay.
 Useful for long-running simulations or batch processing of multiple patterns.
 """
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 from datetime import datetime
-from game_of_life.board import Board
+
+import numpy as np
+
+from game_of_life.board import Board, write_snapshot_file
+from game_of_life.cycles import replay_cycles
 from game_of_life.rules import evolve_grid
 from game_of_life.errors import SimulationOverflowError, GameOfLifeError
 
+MAX_PENDING_SNAPSHOTS = 8
+"""Upper bound on encoded snapshots waiting for the background writer."""
+
+
+def _generation_frames(board: Board, generations: int, rule_name: str):
+    """Evolves the board and yields the encoded snapshot of every generation.
+
+    As soon as a state repeats, the remaining generations are replayed from
+    the cached snapshots instead of being evolved and encoded again (see
+    replay_cycles).
+
+    Args:
+        board: Board holding the initial state; it is evolved in place.
+        generations: Number of generations to advance past the initial one.
+        rule_name: Rule set to apply.
+
+    Yields:
+        The snapshot bytes for generations 0 through generations.
+    """
+    # Two buffers are swapped each generation so the loop never allocates.
+    spare = np.empty_like(board.grid)
+
+    def step():
+        nonlocal spare
+        evolve_grid(board.grid, rule_name, out=spare)
+        board.grid, spare = spare, board.grid
+        return board.grid
+
+    # Each state passed to encode is board.grid, which snapshot_bytes reads.
+    yield from replay_cycles(
+        board.grid,
+        step,
+        count=generations + 1,
+        encode=lambda state: board.snapshot_bytes(),
+    )
+
 
 def run_simulation(
     pattern_file: str,
@@ -19,13 +62,17 @@ def run_simulation(
     generations: int = 10,
     rule_name: str = "conway",
     log_dir: str = "logs",
+    combined_log: bool = False,
 ):
     """Runs a headless Game of Life simulation with generation snapshots.
 
     Loads an initial pattern and evolves it for the specified number of
     generations, saving each state to a timestamped text file in the log
     directory. This enables batch processing and post-simulation analysis
-    without real-time visualization overhead.
+    without real-time visualization overhead. Snapshots are encoded on the
+    simulation thread and written by a background thread, so disk I/O
+    overlaps with evolving the next generation. Once the pattern repeats a
+    previous state, the rest of the run is replayed from cached frames.
 
     Args:
         pattern_file: Path to text file containing the initial pattern.
@@ -34,6 +81,9 @@ def run_simulation(
         generations: Number of generations to simulate. Defaults to 10.
         rule_name: Rule set to apply (e.g., "conway"). Defaults to "conway".
         log_dir: Directory path where snapshots will be saved. Defaults to "logs".
+        combined_log: If True, write every generation into a single log file,
+            each frame preceded by a "# gen N" header line, instead of one
+            file per generation. Defaults to False.
 
     Raises:
         SimulationOverflowError: If generations exceeds 10,000 (safety limit).
@@ -42,6 +92,7 @@ def run_simulation(
     Note:
         Files are named with the pattern:
         {pattern_name}_{rule}_{generation}_{timestamp}.txt
+        or {pattern_name}_{rule}_{timestamp}.txt for a combined log.
         This allows multiple runs to coexist without overwriting.
     """
     if generations > 10_000:
@@ -57,12 +108,30 @@ def run_simulation(
     base_name = Path(pattern_file).stem
     print(f"Starting simulation for pattern {base_name!r}, rule={rule_name}")
 
-    for gen in range(generations + 1):
-        snapshot_name = f"{base_name}_{rule_name}_gen{gen:04d}_{timestamp}.txt"
-        board.save_snapshot(log_path / snapshot_name)
+    with ExitStack() as stack:
+        combined = None
+        if combined_log:
+            combined_path = log_path / f"{base_name}_{rule_name}_{timestamp}.txt"
+            combined = stack.enter_context(combined_path.open("wb"))
+        writer = stack.enter_context(ThreadPoolExecutor(max_workers=1))
+
+        pending = deque()
+        frames = _generation_frames(board, generations, rule_name)
+        for gen, frame in enumerate(frames):
+            if len(pending) >= MAX_PENDING_SNAPSHOTS:
+                pending.popleft().result()
+            if combined is not None:
+                header = f"# gen {gen}\n".encode()
+                pending.append(writer.submit(combined.writelines, (header, frame)))
+            else:
+                snapshot_name = f"{base_name}_{rule_name}_gen{gen:04d}_{timestamp}.txt"
+                pending.append(
+                    writer.submit(write_snapshot_file, log_path / snapshot_name, frame)
+                )
 
-        if gen < generations:
-            board.grid = evolve_grid(board.grid, rule_name)
+        # Surface any write error from the snapshots still in flight.
+        for future in pending:
+            future.result()
 
 
 if __name__ == "__main__":
@@ -6,6 +6,9 @@ smoother animation with reduced flickering.
 """
 
 import time
+
+import numpy as np
+
 from game_of_life.board import Board
 from game_of_life.rules import evolve_grid
 
@@ -51,6 +54,7 @@ def run(pattern_file, rows=20, cols=20, generations=200, delay=0.1):
     """
     board = Board(rows, cols)
     board.load_pattern(pattern_file)
+    spare = np.empty_like(board.grid)
 
     print("\033[?25l", end="")
 
@@ -71,7 +75,8 @@ def run(pattern_file, rows=20, cols=20, generations=200, delay=0.1):
                 print(f"Generation {gen}")
                 print(grid_str)
 
-            board.grid = evolve_grid(board.grid)
+            evolve_grid(board.grid, out=spare)
+            board.grid, spare = spare, board.grid
             time.sleep(delay)
 
     finally:
@@ -7,6 +7,9 @@ the screen between generations for animation effect.
 
 import time
 import os
+
+import numpy as np
+
 from game_of_life.board import Board
 from game_of_life.rules import evolve_grid
 
@@ -41,12 +44,14 @@ def run(pattern_file, rows=20, cols=20, generations=100):
     """
     board = Board(rows, cols)
     board.load_pattern(pattern_file)
+    spare = np.empty_like(board.grid)
 
     for gen in range(generations):
         os.system("cls" if os.name == "nt" else "clear")
         print(f"Generation {gen}")
         print_grid(board.grid)
-        board.grid = evolve_grid(board.grid)
+        evolve_grid(board.grid, out=spare)
+        board.grid, spare = spare, board.grid
         time.sleep(0.2)
 
 
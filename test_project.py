@@ -1,8 +1,43 @@
 # pytest test implementing the assigned test
 
+import time
+
+import numpy as np
 import pytest
+from game_of_life.bitboard import evolve_packed, pack, unpack
 from game_of_life.board import Board
-from game_of_life.rules import evolve_grid
+from game_of_life.cycles import replay_cycles
+import main
+import visualize
+from main import run_simulation
+from game_of_life.errors import GridSizeError, PatternParseError
+from game_of_life.patterns import parse_pattern_file
+from game_of_life import rules
+from game_of_life.rules import (
+    _FAST_KERNELS,
+    _evolve_native,
+    _rule_table,
+    conway_rule,
+    evolve_grid,
+    neighbor_counts,
+    register_rule,
+)
+
+
+def _reference_step(grid, rule=conway_rule):
+    """Brute-force next generation: counts each cell's neighbors directly."""
+    rows, cols = grid.shape
+    out = np.zeros((rows, cols), dtype=np.uint8)
+    for r in range(rows):
+        for c in range(cols):
+            n = sum(
+                int(grid[r + dr, c + dc])
+                for dr in (-1, 0, 1)
+                for dc in (-1, 0, 1)
+                if (dr or dc) and 0 <= r + dr < rows and 0 <= c + dc < cols
+            )
+            out[r, c] = rule(int(grid[r, c]), n)
+    return out
 
 
 def test_load_pattern():
@@ -21,3 +56,308 @@ def test_board_init():
     board = Board(10, 10)
     assert len(board.grid) == 10
     assert all(all(cell == 0 for cell in row) for row in board.grid)
+
+
+def test_evolve_grid_blinker_period():
+    grid = [[0, 0, 0], [1, 1, 1], [0, 0, 0]]
+    once = evolve_grid(grid)
+    assert once.tolist() == [[0, 1, 0], [0, 1, 0], [0, 1, 0]]
+    assert evolve_grid(once).tolist() == grid
+
+
+def test_evolve_grid_numpy_path_matches_kernel(monkeypatch):
+    monkeypatch.setattr(rules, "_compiled_kernel", None)
+    rng = np.random.default_rng(0)
+    grid = rng.integers(0, 2, size=(17, 23), dtype=np.uint8)
+    expected = _reference_step(grid)
+    out = np.empty_like(grid)
+    assert evolve_grid(grid, out=out) is out
+    assert np.array_equal(out, expected)
+
+
+def test_evolve_packed_matches_evolve_grid():
+    rng = np.random.default_rng(1)
+    grid = rng.integers(0, 2, size=(9, 70), dtype=np.uint8)
+    words = pack(grid)
+    assert np.array_equal(unpack(words, 70), grid)
+    for _ in range(3):
+        grid = evolve_grid(grid)
+        words = evolve_packed(words, 70)
+        assert np.array_equal(unpack(words, 70), grid)
+
+
+def test_save_snapshot(tmp_path):
+    board = Board(2, 3)
+    board.grid[0][1] = 1
+    board.grid[1][2] = 1
+    out = tmp_path / "snap" / "gen0.txt"
+    board.save_snapshot(out)
+    assert out.read_text() == ".*.\n..*\n"
+
+
+def test_parse_pattern_file_cache_invalidates_on_change(tmp_path):
+    pattern = tmp_path / "glider.txt"
+    pattern.write_text("(0, 1) *\n")
+    first = parse_pattern_file(pattern)
+    assert parse_pattern_file(pattern) is first
+    pattern.write_text("(0, 1) *\n(2, 3) *\n")
+    rows, cols, live_rows, live_cols = parse_pattern_file(pattern)
+    assert (rows, cols) == (3, 4)
+    assert live_rows.tolist() == [0, 2]
+    assert live_cols.tolist() == [1, 3]
+
+
+def test_parse_pattern_file_reports_malformed_line(tmp_path):
+    pattern = tmp_path / "bad.txt"
+    pattern.write_text("# header\n(0, 1) *\n(2, x) *\n")
+    with pytest.raises(PatternParseError, match="line 3"):
+        parse_pattern_file(pattern)
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_evolve_grid_custom_rule(monkeypatch, compiled):
+    monkeypatch.setattr(rules, "_RULES_REGISTRY", dict(rules._RULES_REGISTRY))
+    monkeypatch.setattr(rules, "_FAST_KERNELS", dict(rules._FAST_KERNELS))
+    if not compiled:
+        monkeypatch.setattr(rules, "_compiled_kernel", None)
+
+    @register_rule("seeds")
+    def seeds_rule(current_state, live_neighbors):
+        if current_state == 1:
+            return 0
+        return 1 if live_neighbors == 2 else 0
+
+    rng = np.random.default_rng(2)
+    grid = rng.integers(0, 2, size=(12, 15), dtype=np.uint8)
+    expected = _reference_step(grid, seeds_rule)
+    assert np.array_equal(evolve_grid(grid, "seeds"), expected)
+
+
+def test_run_simulation_combined_log(tmp_path):
+    run_simulation(
+        "patterns/blinker.txt", rows=5, cols=5, generations=2,
+        log_dir=tmp_path, combined_log=True,
+    )
+    (log_file,) = tmp_path.iterdir()
+    frames = [f.split("\n", 1) for f in log_file.read_text().split("# gen ")[1:]]
+    assert [gen for gen, _ in frames] == ["0", "1", "2"]
+    assert frames[0][1] == frames[2][1] != frames[1][1]
+
+
+def test_conway_fast_kernel_matches_rule():
+    rng = np.random.default_rng(3)
+    grid = rng.integers(0, 2, size=(20, 31), dtype=np.uint8)
+    out = np.empty_like(grid)
+    _FAST_KERNELS["conway"](grid, out)
+    assert np.array_equal(out, _reference_step(grid))
+
+
+def test_board_grid_assignment_is_dense_uint8():
+    board = Board(2, 2)
+    board.grid = [[0, 1], [1, 0]]
+    assert board.grid.dtype == np.uint8 and board.grid.flags.c_contiguous
+    buffer = np.zeros((2, 2), dtype=np.uint8)
+    board.grid = buffer
+    assert board.grid is buffer
+
+
+def test_run_simulation_replays_cycles(tmp_path, monkeypatch):
+    calls = []
+
+    def counting_evolve(*args, **kwargs):
+        calls.append(1)
+        return evolve_grid(*args, **kwargs)
+
+    monkeypatch.setattr(main, "evolve_grid", counting_evolve)
+    run_simulation("patterns/blinker.txt", rows=5, cols=5, generations=20, log_dir=tmp_path)
+    snapshots = sorted(tmp_path.iterdir())
+    assert len(snapshots) == 21
+    assert len(calls) == 2
+    assert snapshots[1].read_text() == snapshots[19].read_text() != snapshots[20].read_text()
+
+
+@pytest.mark.skipif(_evolve_native is None, reason="C kernel not built")
+def test_native_kernel_matches_rule():
+    rng = np.random.default_rng(4)
+    grid = rng.integers(0, 2, size=(19, 33), dtype=np.uint8)
+    out = np.empty_like(grid)
+    _evolve_native(grid, out, _rule_table(conway_rule))
+    assert np.array_equal(out, _reference_step(grid))
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.float64, np.bool_])
+def test_evolve_outputs_uint8_for_any_input_dtype(dtype):
+    grid = np.array([[0, 0, 0], [1, 1, 1], [0, 0, 0]], dtype=dtype)
+    assert evolve_grid(grid).dtype == np.uint8
+
+
+@pytest.mark.skipif(rules.njit is None, reason="numba not installed")
+def test_serial_and_parallel_numba_kernels_agree():
+    rng = np.random.default_rng(5)
+    table = _rule_table(conway_rule)
+    for shape in [(1, 1), (3, 1), (20, 20), (130, 129)]:
+        grid = rng.integers(0, 2, size=shape, dtype=np.uint8)
+        serial, parallel = np.empty_like(grid), np.empty_like(grid)
+        rules._evolve_numba_serial(grid, serial, table)
+        rules._evolve_numba(grid, parallel, table)
+        assert np.array_equal(serial, parallel)
+        assert np.array_equal(serial, _reference_step(grid))
+
+
+def test_evolve_grid_batch_matches_single_grids():
+    rng = np.random.default_rng(6)
+    grids = rng.integers(0, 2, size=(5, 12, 17), dtype=np.uint8)
+    out = np.empty_like(grids)
+    assert evolve_grid(grids, out=out) is out
+    for src, dst in zip(grids, out):
+        assert np.array_equal(dst, evolve_grid(src))
+    assert np.array_equal(neighbor_counts(grids)[2], neighbor_counts(grids[2]))
+
+
+def test_evolve_grid_rejects_bad_out():
+    grid = np.ones((6, 7), dtype=np.uint8)
+    for bad in (
+        np.zeros((2, 2), dtype=np.uint8),
+        np.zeros((6, 7), dtype=np.int64),
+        np.zeros((7, 6), dtype=np.uint8).T,
+        grid,
+        [[0] * 7] * 6,
+    ):
+        with pytest.raises(ValueError):
+            evolve_grid(grid, out=bad)
+
+
+def test_replay_cycles_stops_evolving_once_a_state_repeats():
+    calls = []
+
+    def step():
+        calls.append(1)
+        return np.array([[len(calls) % 2]], dtype=np.uint8)
+
+    values = list(replay_cycles(np.zeros((1, 1), np.uint8), step, count=7))
+    assert [int(v[0, 0]) for v in values] == [0, 1, 0, 1, 0, 1, 0]
+    assert len(calls) == 2
+    assert values[0] is values[2] is values[6]
+
+
+def test_replaying_stepper_matches_evolution():
+    rng = np.random.default_rng(7)
+    grid = rng.integers(0, 2, size=(8, 8), dtype=np.uint8)
+    calls = []
+    current = grid
+
+    def step():
+        nonlocal current
+        calls.append(1)
+        current = evolve_grid(current)
+        return current
+
+    replaying = visualize._replaying_stepper(step, grid)
+    expected = grid
+    for _ in range(200):
+        expected = evolve_grid(expected)
+        assert np.array_equal(replaying(), expected)
+    assert len(calls) < 200
+
+
+def test_interned_trajectory_matches_dense_trajectory():
+    grid = np.zeros((5, 5), dtype=np.uint8)
+    grid[2, 1:4] = 1  # blinker
+    frames = visualize._interned_trajectory(grid, 7)
+    expected = [grid]
+    for _ in range(6):
+        expected.append(evolve_grid(expected[-1]))
+    assert len(frames) == 7
+    assert all(np.array_equal(f, e) for f, e in zip(frames, expected))
+    assert frames[0] is frames[2] is frames[6]
+    assert frames[1] is frames[3] is not frames[0]
+    assert grid[2].tolist() == [0, 1, 1, 1, 0]
+    assert visualize._interned_trajectory(grid, 0) == []
+
+
+def _drain(ring, limit=10_000):
+    while limit:
+        taken = ring.take()
+        if taken is not None:
+            return taken
+        limit -= 1
+        time.sleep(0.001)
+    raise AssertionError("no frame produced")
+
+
+def test_frame_ring_yields_generations_in_order():
+    grid = np.zeros((5, 5), dtype=np.uint8)
+    grid[2, 1:4] = 1
+    current = grid
+
+    def step():
+        nonlocal current
+        current = evolve_grid(current)
+        return current
+
+    ring = visualize._FrameRing(step, grid.shape, 2 * visualize.RING_SLOTS + 1)
+    expected = grid
+    for generation in range(1, 2 * visualize.RING_SLOTS + 2):
+        expected = evolve_grid(expected)
+        taken_generation, frame = _drain(ring)
+        assert taken_generation == generation
+        assert np.array_equal(frame, expected)
+    ring.stop()
+
+
+def test_frame_ring_reraises_step_errors():
+    def step():
+        raise RuntimeError("step failed")
+
+    ring = visualize._FrameRing(step, (2, 2), 3)
+    with pytest.raises(RuntimeError, match="step failed"):
+        _drain(ring)
+
+
+def test_evolve_packed_rejects_bad_buffers():
+    grid = np.zeros((5, 5), dtype=np.uint8)
+    grid[2, 1:4] = 1
+    words = pack(grid)
+    for bad in (
+        words,
+        np.zeros((2, 1), dtype=np.uint64),
+        np.zeros(words.shape, dtype=np.int64),
+    ):
+        with pytest.raises(ValueError):
+            evolve_packed(words, 5, out=bad)
+    with pytest.raises(ValueError):
+        evolve_packed(words, 65)
+    with pytest.raises(ValueError):
+        evolve_packed(words.astype(np.int64), 5)
+    assert np.array_equal(unpack(evolve_packed(words, 5), 5), evolve_grid(grid))
+
+
+def test_parse_pattern_file_handles_large_coordinates(tmp_path):
+    pattern = tmp_path / "far.txt"
+    pattern.write_text("(3000000000, 2) *\n")
+    rows, cols, _, _ = parse_pattern_file(pattern)
+    assert (rows, cols) == (3000000001, 3)
+    with pytest.raises(GridSizeError):
+        Board(5, 5).load_pattern(str(pattern))
+
+    huge = tmp_path / "huge.txt"
+    huge.write_text("(0, 0) *\n(100000000000000000000, 1) *\n")
+    with pytest.raises(PatternParseError, match="line 2"):
+        parse_pattern_file(huge)
+
+
+def test_conway_rule_is_scalar():
+    assert conway_rule(1, 2) == 1 and type(conway_rule(1, 2)) is int
+    assert [conway_rule(0, n) for n in range(9)] == [0, 0, 0, 1, 0, 0, 0, 0, 0]
+
+
+def test_packed_stepper_replays_cycles_on_words():
+    rng = np.random.default_rng(8)
+    grid = rng.integers(0, 2, size=(9, 70), dtype=np.uint8)
+    step = visualize._packed_stepper(grid)
+    expected = grid
+    for _ in range(150):
+        expected = evolve_grid(expected)
+        frame = step()
+        assert frame.dtype == np.uint8
+        assert np.array_equal(frame, expected)
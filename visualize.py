@@ -4,50 +4,515 @@ This module provides animated visualization of Game of Life patterns, displaying
 the evolution of cellular automata over multiple generations.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import multiprocessing
+import os
+import queue
+import shutil
+import subprocess
+import threading
+
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
+from game_of_life.bitboard import evolve_packed, pack, unpack
 from game_of_life.board import Board
-from game_of_life.rules import evolve_grid
+from game_of_life.cycles import replay_cycles
+from game_of_life.rules import evolve_grid, neighbor_counts
+
+try:
+    import cupy as cp
+    import cupyx
+except ImportError:  # cupy is optional; the GPU backend is unavailable
+    cp = None
+
+try:
+    import imageio.v3 as iio
+except ImportError:  # imageio is optional; saving animations is unavailable
+    iio = None
+
+GPU_MIN_CELLS = 512 * 512
+"""Board size (in cells) from which backend="auto" moves evolution to the GPU."""
+
+IMSHOW_KWARGS = {"cmap": "binary", "vmin": 0, "vmax": 1, "interpolation": "nearest"}
+"""Fixed imshow settings for 0/1 cell images.
+
+Pinning vmin/vmax stops matplotlib from rescaling the colormap from each
+frame's data, and an all-dead first frame no longer collapses the limits.
+"""
+
+
+def _packed_stepper(grid):
+    """Returns a function that advances a bit-packed copy of grid.
+
+    The board is packed into uint64 words (64 cells per word) once and
+    advanced with the SWAR Conway step, ping-ponging between two word
+    buffers. The step runs once here so any JIT compilation happens before
+    the window opens. Cycles are detected on the packed words, which are 8x
+    smaller than the unpacked grid to copy, hash and keep (see
+    replay_cycles); only the frame on display is unpacked. Unpacking still
+    allocates a fresh display array per frame: np.unpackbits into a new
+    array measured faster than unpacking into a reused buffer by hand.
+
+    Args:
+        grid: 2D uint8 array holding the initial generation.
+
+    Returns:
+        A no-argument function that evolves one generation and returns it
+        unpacked as a 2D uint8 array for display.
+    """
+    cols = grid.shape[1]
+    words = pack(grid)
+    spare = np.empty_like(words)
+    evolve_packed(words, cols, out=spare)
+
+    def advance():
+        nonlocal words, spare
+        evolve_packed(words, cols, out=spare)
+        words, spare = spare, words
+        return words
+
+    states = replay_cycles(words, advance)
+    next(states)  # generation 0 is grid itself
+    return lambda: unpack(next(states), cols)
+
+
+def _gpu_stepper(grid):
+    """Returns a function that advances a CuPy copy of grid on the GPU.
+
+    The board stays resident in device memory between frames; only the
+    finished generation is copied back, into one pinned host buffer that is
+    reused every frame instead of a fresh array per transfer. Neighbor
+    counts reuse the slice-add implementation from game_of_life.rules,
+    which runs unchanged on CuPy arrays.
+
+    Args:
+        grid: 2D uint8 array holding the initial generation.
+
+    Returns:
+        A no-argument function that evolves one generation and returns it
+        as a 2D uint8 NumPy array for display.
+    """
+    src = cp.asarray(grid)
+    dst = cp.empty_like(src)
+    host = cupyx.empty_pinned(grid.shape, dtype=np.uint8)
+
+    def step():
+        nonlocal src, dst
+        n = neighbor_counts(src)
+        n |= src
+        dst[...] = n == 3
+        src, dst = dst, src
+        return src.get(out=host)
+
+    return step
+
+
+def _replaying_stepper(step, grid):
+    """Wraps step so that a repeating board is replayed instead of evolved.
+
+    Used for the GPU stepper, whose frames arrive on the host unpacked (the
+    CPU stepper detects cycles on its packed words instead). Once the board
+    revisits an earlier state, the cycle's frames are returned in turn
+    without calling step again (see replay_cycles). The
+    frames returned are read-only.
+
+    Args:
+        step: No-argument function returning the next generation.
+        grid: 2D uint8 array holding the initial generation.
+
+    Returns:
+        A no-argument function returning the next generation like step.
+    """
+    frames = replay_cycles(grid, step)
+    next(frames)  # generation 0 is grid itself
+    return lambda: next(frames)
+
+
+def _interned_trajectory(grid, generations):
+    """Computes generations frames in which repeated states share one array.
+
+    Each distinct state is stored once, as a read-only view of its raw
+    bytes, and every generation that revisits it refers to that same array.
+    Once a state repeats the rest of the run is filled in from the cycle
+    without evolving further, so a still life or oscillator costs only its
+    period in memory, however many generations are requested.
+
+    Args:
+        grid: 2D uint8 array holding the initial generation.
+        generations: Number of frames to produce, including the initial one.
+
+    Returns:
+        List of generations 2D uint8 arrays.
+    """
+    # New states are evolved into two alternating scratch buffers; the only
+    # copy kept of each is the bytes key that its frame views.
+    scratch = (np.empty_like(grid), np.empty_like(grid))
+    current = grid
+
+    def step():
+        nonlocal current
+        target = scratch[1] if current is scratch[0] else scratch[0]
+        current = evolve_grid(current, out=target)
+        return current
+
+    return list(replay_cycles(grid, step, count=generations, max_bytes=None))
+
+
+def _setup_axes(ax):
+    """Titles the axes and hides their ticks and frame.
+
+    Ticks and spines carry no information for a cell grid, and laying out
+    tick labels dominates the cost of every full redraw.
+    """
+    ax.set_title("Conway's Game of Life Simulation")
+    ax.set_xticks([])
+    ax.set_yticks([])
+    ax.set_frame_on(False)
+
+
+def _generation_text(ax, text=""):
+    """Creates the animated generation counter drawn inside the axes."""
+    return ax.text(
+        0.02, 0.98, text, transform=ax.transAxes, va="top", color="tab:red",
+        animated=True,
+    )
+
 
+SAVE_FPS = 5
+"""Frame rate of saved animations, matching the 200 ms on-screen interval."""
 
-def animate_game(pattern_file, rows=20, cols=20, generations=100):
+VIDEO_SUFFIXES = (".mp4", ".m4v", ".mov", ".mkv", ".webm", ".avi")
+"""Output extensions that ffmpeg encodes as video, with yuv420p pixels."""
+
+RING_SLOTS = 4
+"""Number of preallocated frames the background evolution may run ahead."""
+
+
+class _FrameRing:
+    """Evolves generations on a background thread into a ring of frames.
+
+    The producer thread steps the board as fast as free slots allow and
+    copies each generation into one of RING_SLOTS preallocated buffers, so
+    simulation work overlaps with drawing and a slow step no longer stalls
+    the UI timer. The consumer takes finished frames in order; a slot is
+    handed back to the producer on the next take, by which point the image
+    artist has copied its data.
+
+    Args:
+        step: No-argument function returning the next generation.
+        shape: Shape (rows, cols) of the grids returned by step.
+        generations: Number of generations to produce.
+    """
+
+    def __init__(self, step, shape, generations):
+        self._step = step
+        self._generations = generations
+        self._frames = np.empty((RING_SLOTS,) + tuple(shape), dtype=np.uint8)
+        self._free = queue.Queue()
+        for slot in range(RING_SLOTS):
+            self._free.put(slot)
+        self._ready = queue.Queue()
+        self._held = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def _produce(self):
+        """Producer loop run on the background thread.
+
+        An exception from step is handed to the consumer through the ready
+        queue, so take re-raises it instead of the thread dying silently.
+        """
+        for generation in range(1, self._generations + 1):
+            try:
+                grid = self._step()
+            except Exception as exc:
+                self._ready.put(exc)
+                return
+            while True:
+                if self._stop.is_set():
+                    return
+                try:
+                    slot = self._free.get(timeout=0.1)
+                    break
+                except queue.Empty:
+                    continue
+            np.copyto(self._frames[slot], grid)
+            self._ready.put((generation, slot))
+
+    def take(self):
+        """Returns (generation, frame) for the next generation, or None.
+
+        None means the producer has not finished the next generation yet.
+        The returned frame is only valid until the following call.
+
+        Raises:
+            Exception: Whatever step raised on the producer thread.
+        """
+        if self._held is not None:
+            self._free.put(self._held)
+            self._held = None
+        try:
+            item = self._ready.get_nowait()
+        except queue.Empty:
+            return None
+        if isinstance(item, Exception):
+            raise item
+        generation, slot = item
+        self._held = slot
+        return generation, self._frames[slot]
+
+    def stop(self):
+        """Asks the producer thread to exit."""
+        self._stop.set()
+
+
+def _render_frame(item):
+    """Renders one generation to an RGB image off screen.
+
+    Runs in a worker process. The figure is built directly on the Agg
+    canvas without pyplot, so no GUI backend or global figure state is
+    involved and frames can be drawn independently of each other.
+
+    Args:
+        item: Tuple (generation, grid) with the grid as a 2D uint8 array.
+
+    Returns:
+        Array of shape (height, width, 3) with dtype uint8.
+    """
+    generation, grid = item
+    fig = Figure()
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    _setup_axes(ax)
+    ax.imshow(grid, **IMSHOW_KWARGS)
+    _generation_text(ax, f"Generation: {generation}")
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba())[..., :3].copy()
+
+
+@contextlib.contextmanager
+def _frame_writer(save_path):
+    """Opens save_path for writing RGB frames and yields a write function.
+
+    When ffmpeg is on PATH the raw rgb24 pixels are piped straight to it, so
+    no per-frame encoding happens in Python; otherwise imageio's Pillow
+    plugin writes a GIF at SAVE_FPS. The ffmpeg process is started on the
+    first frame, once the image size is known.
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails to write the file.
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        with iio.imopen(save_path, "w", plugin="pillow") as out:
+            yield lambda image: out.write(
+                image, is_batch=False, duration=1000 // SAVE_FPS, loop=0
+            )
+        return
+
+    proc = None
+
+    def write(image):
+        nonlocal proc
+        if proc is None:
+            height, width, _ = image.shape
+            args = [
+                ffmpeg, "-y", "-loglevel", "error",
+                "-f", "rawvideo", "-pixel_format", "rgb24",
+                "-video_size", f"{width}x{height}",
+                "-framerate", str(SAVE_FPS),
+                "-i", "-",
+            ]
+            if os.path.splitext(save_path)[1].lower() in VIDEO_SUFFIXES:
+                # yuv420p needs even dimensions but plays everywhere; left to
+                # itself libx264 picks yuv444p for rgb24 input.
+                args += [
+                    "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+                    "-pix_fmt", "yuv420p",
+                ]
+            args.append(os.fspath(save_path))
+            proc = subprocess.Popen(args, stdin=subprocess.PIPE)
+        proc.stdin.write(image)
+
+    try:
+        yield write
+    finally:
+        if proc is not None:
+            proc.stdin.close()
+            if proc.wait() != 0:
+                raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+
+def _save_animation(frames, save_path):
+    """Renders frames in parallel processes and writes them to save_path.
+
+    Args:
+        frames: Sequence of 2D uint8 grids to render, one per generation.
+        save_path: Output file; the format follows from its extension.
+    """
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(frames) // (workers * 4))
+    # Workers are spawned rather than forked: forking after the parallel
+    # Numba kernel has started its thread pool can hang the parent on exit.
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=ctx
+    ) as ex, _frame_writer(save_path) as write:
+        for image in ex.map(_render_frame, enumerate(frames), chunksize=chunksize):
+            write(image)
+
+
+def animate_game(
+    pattern_file,
+    rows=20,
+    cols=20,
+    generations=100,
+    precompute=False,
+    backend="auto",
+    save_path=None,
+):
     """Animates Conway's Game of Life simulation from a pattern file.
 
     Loads an initial pattern, evolves it according to Game of Life rules,
     and displays an animated visualization showing the progression through
     multiple generations. The animation updates every 200 milliseconds.
 
+    The live animation evolves the board on the CPU in bit-packed form
+    (64 cells per uint64 word) with the SWAR Conway step, or on the GPU
+    with CuPy when that backend is selected; either way the grid is only
+    converted to a plain uint8 array for display. Once the board repeats an
+    earlier state, the cycle is replayed from cached frames instead of
+    being evolved further. Evolution runs on a background thread a few
+    frames ahead of the display. Frames are shown by a canvas timer that
+    blits just the axes over a saved background, rather than by
+    FuncAnimation, and stop after the last generation.
+
+    With precompute=True the whole trajectory is computed up front and
+    played back with ArtistAnimation, so no simulation work or Python
+    callback runs between frames. Repeated states share one frame and one
+    image artist, but a pattern that never repeats costs one image artist
+    per generation, so this suits short runs.
+
+    With save_path set nothing is shown: the trajectory is precomputed and
+    the frames are rendered off screen with Agg across a process pool, then
+    piped as raw RGB to ffmpeg in generation order (or written as a GIF
+    with imageio when ffmpeg is not on PATH). This is the way to produce
+    long runs, since rendering scales with the number of cores.
+
     Args:
         pattern_file: Path to text file containing the initial pattern.
         rows: Number of rows in the game board grid. Defaults to 20.
         cols: Number of columns in the game board grid. Defaults to 20.
         generations: Number of generations to simulate and display. Defaults to 100.
+        precompute: Whether to compute all generations before displaying.
+            Defaults to False.
+        backend: "cpu", "gpu" or "auto". "auto" uses the GPU when CuPy is
+            installed and the board has at least GPU_MIN_CELLS cells.
+            Ignored when precompute is True. Defaults to "auto".
+        save_path: Optional output file (e.g. .gif or .mp4) to render the
+            animation to instead of showing it. Defaults to None.
+
+    Raises:
+        ValueError: If backend is unknown, "gpu" without CuPy installed, or
+            save_path cannot be written: without ffmpeg on PATH only .gif
+            files can be saved, and only with imageio installed.
     """
+    if backend not in ("auto", "cpu", "gpu"):
+        raise ValueError(f"Unknown backend: {backend}. Expected auto, cpu or gpu")
+    if backend == "gpu" and cp is None:
+        raise ValueError("The gpu backend requires CuPy to be installed")
+    if save_path is not None and shutil.which("ffmpeg") is None:
+        if os.path.splitext(save_path)[1].lower() != ".gif":
+            raise ValueError("Saving anything but a .gif requires ffmpeg on PATH")
+        if iio is None:
+            raise ValueError("Saving a .gif without ffmpeg requires imageio")
+
     board = Board(rows, cols)
     board.load_pattern(pattern_file)
 
+    if save_path is not None:
+        _save_animation(_interned_trajectory(board.grid, generations), save_path)
+        return
+
     fig, ax = plt.subplots()
-    ax.set_title("Conway's Game of Life Simulation")
+    _setup_axes(ax)
+
+    if precompute:
+        frames = _interned_trajectory(board.grid, generations)
+        images = {}  # id of an interned frame -> the image artist showing it
+        artists = []
+        for g, frame in enumerate(frames):
+            if id(frame) not in images:
+                images[id(frame)] = ax.imshow(frame, **IMSHOW_KWARGS, animated=True)
+            artists.append(
+                [images[id(frame)], _generation_text(ax, f"Generation: {g}")]
+            )
+        ani = animation.ArtistAnimation(fig, artists, interval=200, blit=True)
+        plt.show()
+        return
+
+    use_gpu = backend == "gpu" or (
+        backend == "auto" and cp is not None and rows * cols >= GPU_MIN_CELLS
+    )
+    if use_gpu:
+        step = _replaying_stepper(_gpu_stepper(board.grid), board.grid)
+    else:
+        step = _packed_stepper(board.grid)
+    frames = _FrameRing(step, board.grid.shape, generations)
 
-    img = ax.imshow(board.grid, cmap="binary")
+    img = ax.imshow(board.grid, **IMSHOW_KWARGS, animated=True)
+    # The generation counter is an animated artist inside the axes so it is
+    # redrawn with the blitted image; updating the xlabel instead would
+    # force a full figure redraw every frame.
+    gen_text = _generation_text(ax, "Generation: 0")
+    artists = (img, gen_text)
 
-    def update(frame):
-        """Updates the board state for each animation frame.
+    canvas = fig.canvas
+    background = None
 
-        Args:
-            frame: Current frame number (generation count).
+    def capture_background(event):
+        """Saves the static figure after each full redraw (first show, resize).
 
-        Returns:
-            List containing the updated image artist for blitting.
+        The animated artists are left out of full redraws, so they are drawn
+        on top of the captured background here to keep them visible.
         """
-        board.grid = evolve_grid(board.grid)
-        img.set_data(board.grid)
-        ax.set_xlabel(f"Generation: {frame}")
-        return [img]
+        nonlocal background
+        background = canvas.copy_from_bbox(fig.bbox)
+        for artist in artists:
+            ax.draw_artist(artist)
 
-    ani = animation.FuncAnimation(
-        fig, update, frames=generations, interval=200, blit=True
-    )
+    def advance():
+        """Shows the next finished generation by blitting the axes."""
+        if background is None:  # the window has not been drawn yet
+            return
+        try:
+            taken = frames.take()
+        except Exception:
+            timer.stop()  # report the producer's error once, then halt
+            raise
+        if taken is None:  # the next generation is still being computed
+            return
+        generation, grid = taken
+        img.set_data(grid)
+        gen_text.set_text(f"Generation: {generation}")
+        canvas.restore_region(background)
+        for artist in artists:
+            ax.draw_artist(artist)
+        canvas.blit(ax.bbox)
+        canvas.flush_events()
+        if generation >= generations:
+            timer.stop()
+
+    canvas.mpl_connect("draw_event", capture_background)
+    canvas.mpl_connect("close_event", lambda event: frames.stop())
+    timer = canvas.new_timer(interval=200)
+    timer.add_callback(advance)
+    timer.start()
 
     plt.show()
 